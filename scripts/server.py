@@ -1,11 +1,25 @@
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import json
+import os
+import sys
+import threading
 import time
-import base64
+from email.utils import formatdate
+from urllib.parse import parse_qsl
+import binascii
+import hmac
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 HOST = "0.0.0.0"
 PORT = 8000
 
+# Log incoming request headers when started with DEBUG=1
+DEBUG = os.getenv("DEBUG") == "1"
+
 USERNAME = "admin"
 PASSWORD = "secret"
 BEARER_TOKEN = "abc123-def456-ghi789"
@@ -21,58 +35,268 @@ OAUTH_AUTH0_CLIENT_SECRET = "auth0_secret_abc"
 OAUTH_APIGEE_CLIENT_ID = "apigee_client_def"
 OAUTH_APIGEE_CLIENT_SECRET = "apigee_secret_ghi"
 
+# Authorization header schemes
+BASIC_PREFIX = "Basic "
+BEARER_PREFIX = "Bearer "
+APIKEY_PREFIX = "ApiKey "
+
+# Upper bound on the number of fields parsed from an OAuth form body
+MAX_FORM_FIELDS = 16
+
+# Upper bound on POST bodies (OAuth requests are tiny)
+MAX_BODY = 8192
+
+# Per-thread request body buffer. ThreadingHTTPServer runs one thread per
+# connection, so this is only reused across requests on a kept-alive
+# connection; it starts at the first body's size and grows up to MAX_BODY.
+_buffers = threading.local()
+
+# Upper bound on the encoded Basic Auth credentials we are willing to decode
+MAX_BASIC_CREDENTIALS = 1024
+
+
+def json_dumps(obj):
+    """Serialize obj to compact JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data):
+    """Parse JSON from bytes, a memoryview or str (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def secure_equals(value, expected):
+    """Constant-time comparison of a client-supplied value against an ASCII secret"""
+    # Non-ASCII input can never match and would make compare_digest raise
+    if not isinstance(value, str) or not value.isascii():
+        return False
+    return hmac.compare_digest(value, expected)
+
+
+def basic_auth_blob(client_id, client_secret):
+    """Base64 "id:secret" exactly as it appears after "Basic " in the header"""
+    raw = f"{client_id}:{client_secret}".encode("utf-8")
+    return binascii.b2a_base64(raw, newline=False).decode("ascii")
+
+
+# Encoded OAuth client credentials mapped to the client they identify
+OAUTH_BASIC_CREDENTIALS = {
+    basic_auth_blob(OAUTH_CLIENT_ID, OAUTH_CLIENT_SECRET): "generic",
+    basic_auth_blob(OAUTH_COGNITO_CLIENT_ID, OAUTH_COGNITO_CLIENT_SECRET): "cognito",
+}
+
+
+def oauth_basic_client(encoded):
+    """Return the OAuth client for an encoded Basic Auth blob, or None"""
+    client = OAUTH_BASIC_CREDENTIALS.get(encoded)
+
+    # Confirm the hit in constant time against every known client
+    matched = False
+    for blob in OAUTH_BASIC_CREDENTIALS:
+        matched |= secure_equals(encoded, blob)
+    return client if matched else None
+
+
+# Static response bodies, serialized once at import
+HELLO_BODY = b'{"hello":"world"}'
+SLOW_BODY = b'{"status":"slow response"}'
+ECHO_BODY = b'{"message":"This is a POST response"}'
+NOT_FOUND_BODY = b'{"error":"Not Found"}'
+UNAUTH_BASIC_BODY = b'{"error":"Unauthorized"}'
+UNAUTH_BEARER_BODY = b'{"error":"Bearer token required"}'
+UNAUTH_APIKEY_BODY = b'{"error":"Invalid API key"}'
+BEARER_OK_BODY = b'{"bearer":"success","token":"valid"}'
+APIKEY_OK_BODY = b'{"apikey":"success","key":"valid"}'
+BAD_LENGTH_BODY = b'{"error":"Invalid Content-Length"}'
+TOO_LARGE_BODY = b'{"error":"Payload Too Large"}'
+TRANSFER_ENCODING_BODY = b'{"error":"Transfer-Encoding not supported"}'
+OAUTH_TOKEN_TEMPLATE = (
+    b'{"access_token":"oauth_token_%s_%d","token_type":"Bearer",'
+    b'"expires_in":3600,"scope":"read:users write:orders"}'
+)
+
+# Extra header lines for prebuilt header blocks
+WWW_AUTH_BASIC = b'WWW-Authenticate: Basic realm="Login Required"\r\n'
+WWW_AUTH_BEARER = b'WWW-Authenticate: Bearer realm="API Access"\r\n'
+CONNECTION_CLOSE = b"Connection: close\r\n"
+
+# Prebuilt status line + headers, keyed by (handler class, status, extra)
+_header_blocks = {}
+
+
+# Current Unix time in whole seconds and its HTTP Date form, refreshed by a
+# background thread once a DevServer starts listening
+_now = None
+_http_date = None
+_clock_started = False
+
+
+def _update_clock():
+    """Refresh _now and _http_date from the system clock"""
+    global _now, _http_date
+    _now = int(time.time())
+    _http_date = formatdate(_now, usegmt=True).encode("ascii")
+
+
+def _tick_clock():
+    """Keep the cached time current, waking at each second boundary"""
+    while True:
+        time.sleep(1 - time.time() % 1)
+        _update_clock()
+
+
+def start_clock():
+    """Start the background clock thread (once per process)"""
+    global _clock_started
+    if _clock_started:
+        return
+    _clock_started = True
+    _update_clock()
+    threading.Thread(target=_tick_clock, daemon=True).start()
+
+
+class DevServer(ThreadingHTTPServer):
+    def server_activate(self):
+        super().server_activate()
+        start_clock()
+
+
 class SimpleHandler(BaseHTTPRequestHandler):
+    # Keep connections open between requests; every response sets Content-Length
+    protocol_version = "HTTP/1.1"
+
     def _log_headers(self):
-        """Helper: log incoming request headers"""
-        print(f"Headers for {self.command} {self.path}:")
-        for header, value in self.headers.items():
-            print(f"  {header}: {value}")
-        print()
+        """Helper: log incoming request headers (only when DEBUG is set)"""
+        if not DEBUG:
+            return
+
+        lines = [f"Headers for {self.command} {self.path}:"]
+        lines.extend(f"  {header}: {value}" for header, value in self.headers.items())
+        sys.stderr.write("\n".join(lines) + "\n\n")
+
+    def _header_block(self, status, extra=b""):
+        """Helper: status line + headers, formatted with (Date value, body length)"""
+        key = (type(self), status, extra)
+        block = _header_blocks.get(key)
+        if block is None:
+            phrase = self.responses[status][0] if status in self.responses else ""
+            head = (
+                f"{self.protocol_version} {status} {phrase}\r\n"
+                f"Server: {self.version_string()}\r\n"
+            ).encode("latin-1").replace(b"%", b"%%")
+            block = _header_blocks[key] = (
+                head +
+                b"Date: %s\r\n" +
+                extra +
+                b"Content-Type: application/json\r\n"
+                b"Content-Length: %d\r\n\r\n"
+            )
+        return block
+
+    def _send_bytes(self, body, status=200, extra=b""):
+        """Helper: send pre-serialized JSON body behind a prebuilt header block"""
+        header_block = self._header_block(status, extra)
+        self.log_request(status)
+        # Single write: wfile is unbuffered, so each write is its own send()
+        self.wfile.write(header_block % (_http_date, len(body)) + body)
 
     def _send_json(self, obj, status=200):
         """Helper: send JSON response"""
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(obj).encode("utf-8"))
+        self._send_bytes(json_dumps(obj), status)
 
     def _unauthorized(self):
         """Helper: send 401 response with Basic Auth challenge"""
-        self.send_response(401)
-        self.send_header("WWW-Authenticate", 'Basic realm="Login Required"')
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(b'{"error":"Unauthorized"}')
+        self._send_bytes(UNAUTH_BASIC_BODY, 401, WWW_AUTH_BASIC)
 
     def _unauthorized_bearer(self):
         """Helper: send 401 response with Bearer Auth challenge"""
-        self.send_response(401)
-        self.send_header("WWW-Authenticate", 'Bearer realm="API Access"')
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(b'{"error":"Bearer token required"}')
+        self._send_bytes(UNAUTH_BEARER_BODY, 401, WWW_AUTH_BEARER)
 
     def _unauthorized_apikey(self):
         """Helper: send 401 response for API key authentication"""
-        self.send_response(401)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(b'{"error":"Invalid API key"}')
-
-    def _validate_basic_auth(self, expected_client_id, expected_client_secret):
-        """Helper: validate OAuth Basic Auth credentials"""
-        auth_header = self.headers.get("Authorization")
-        if not auth_header or not auth_header.startswith("Basic "):
-            return False
+        self._send_bytes(UNAUTH_APIKEY_BODY, 401)
+
+    def _basic_auth_credentials(self):
+        """Helper: decode Basic Auth header into (user, secret), or None"""
+        auth_header = self.headers.get("Authorization", "")
+        if auth_header[:len(BASIC_PREFIX)] != BASIC_PREFIX:
+            return None
+
+        encoded = auth_header[len(BASIC_PREFIX):]
+        if len(encoded) > MAX_BASIC_CREDENTIALS:
+            return None
 
         try:
-            encoded = auth_header.split(" ", 1)[1]
-            decoded = base64.b64decode(encoded).decode("utf-8")
-            client_id, client_secret = decoded.split(":", 1)
-            return client_id == expected_client_id and client_secret == expected_client_secret
-        except Exception:
+            decoded = binascii.a2b_base64(encoded).decode("utf-8")
+            user, secret = decoded.split(":", 1)
+        except (binascii.Error, ValueError):
+            return None
+        return user, secret
+
+    def _validate_basic_auth(self, expected_client):
+        """Helper: validate OAuth Basic Auth credentials for the given client"""
+        auth_header = self.headers.get("Authorization", "")
+        if auth_header[:len(BASIC_PREFIX)] != BASIC_PREFIX:
             return False
 
+        client = oauth_basic_client(auth_header[len(BASIC_PREFIX):].strip())
+        if client is None:
+            # Not the canonical encoding (unpadded, wrapped, ...): decode it
+            # like /secure does and look up the re-encoded credentials
+            credentials = self._basic_auth_credentials()
+            if credentials is not None:
+                client = oauth_basic_client(basic_auth_blob(*credentials))
+        return client == expected_client
+
+    def _read_body(self):
+        """Helper: read the request body into the per-thread buffer
+
+        Returns a memoryview valid until the next request on this thread, or
+        sends 400/413/501 and returns None when Content-Length is bad or too
+        large, or the body uses a Transfer-Encoding (chunked bodies are not
+        decoded, so their framing would be parsed as the next request).
+        """
+        if "Transfer-Encoding" in self.headers:
+            self.close_connection = True
+            self._send_bytes(TRANSFER_ENCODING_BODY, 501, CONNECTION_CLOSE)
+            return None
+
+        try:
+            content_length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            content_length = -1
+
+        if not 0 <= content_length <= MAX_BODY:
+            # The body is left unread, so this connection cannot be reused
+            self.close_connection = True
+            if content_length < 0:
+                self._send_bytes(BAD_LENGTH_BODY, 400, CONNECTION_CLOSE)
+            else:
+                self._send_bytes(TOO_LARGE_BODY, 413, CONNECTION_CLOSE)
+            return None
+
+        if content_length == 0:
+            return memoryview(b"")
+
+        buf = getattr(_buffers, "body", None)
+        if buf is None or len(buf) < content_length:
+            buf = _buffers.body = bytearray(content_length)
+        view = memoryview(buf)[:content_length]
+        return view[:self.rfile.readinto(view)]
+
+    def _read_form(self):
+        """Helper: parse the form-encoded request body, or None if malformed"""
+        try:
+            return dict(parse_qsl(str(self.body, 'utf-8'), max_num_fields=MAX_FORM_FIELDS))
+        except ValueError:
+            return None
+
     def _oauth_error(self, error, description=""):
         """Helper: send OAuth error response"""
         response = {"error": error}
@@ -82,178 +306,202 @@ class SimpleHandler(BaseHTTPRequestHandler):
 
     def _oauth_success(self, token_suffix=""):
         """Helper: send OAuth success response"""
-        self._send_json({
-            "access_token": f"oauth_token_{token_suffix}_{int(time.time())}",
-            "token_type": "Bearer",
-            "expires_in": 3600,
-            "scope": "read:users write:orders"
-        })
+        self._send_bytes(OAUTH_TOKEN_TEMPLATE % (token_suffix.encode("ascii"), _now))
+
+    def _handle_hello(self):
+        """GET /hello: simple GET endpoint"""
+        self._send_bytes(HELLO_BODY)
+
+    def _handle_slow(self):
+        """GET /slow: slow GET endpoint (wait 1 second)"""
+        time.sleep(1)
+        self._send_bytes(SLOW_BODY)
+
+    def _handle_bearer(self):
+        """GET /bearer: GET endpoint with Bearer Auth"""
+        auth_header = self.headers.get("Authorization", "")
+        if auth_header[:len(BEARER_PREFIX)] != BEARER_PREFIX:
+            self._unauthorized_bearer()
+            return
+
+        token = auth_header[len(BEARER_PREFIX):].strip()
+        if secure_equals(token, BEARER_TOKEN):
+            self._send_bytes(BEARER_OK_BODY)
+        else:
+            self._unauthorized_bearer()
 
-    def do_GET(self):
-        self._log_headers()
-        if self.path == "/hello":
-            # simple GET endpoint
-            self._send_json({"hello": "world"})
-        elif self.path == "/slow":
-            # slow GET endpoint (wait 1 second)
-            time.sleep(1)
-            self._send_json({"status": "slow response"})
-        elif self.path == "/bearer":
-            # GET endpoint with Bearer Auth
-            auth_header = self.headers.get("Authorization")
-            if not auth_header or not auth_header.startswith("Bearer "):
-                self._unauthorized_bearer()
-                return
-
-            token = auth_header.split(" ", 1)[1].strip()
-            if token == BEARER_TOKEN:
-                self._send_json({"bearer": "success", "token": "valid"})
-            else:
-                self._unauthorized_bearer()
-        elif self.path == "/apikey":
-            # GET endpoint with API Key Auth (supports both Authorization header and X-API-Key)
-            auth_header = self.headers.get("Authorization")
-            api_key_header = self.headers.get("X-API-Key")
-
-            api_key = None
-
-            # Check Authorization header first
-            if auth_header and auth_header.startswith("ApiKey "):
-                api_key = auth_header.split(" ", 1)[1].strip()
-            # Fall back to X-API-Key header
-            elif api_key_header:
-                api_key = api_key_header.strip()
-
-            if not api_key:
-                self._unauthorized_apikey()
-                return
-
-            if api_key == API_KEY:
-                self._send_json({"apikey": "success", "key": "valid"})
-            else:
-                self._unauthorized_apikey()
-        elif self.path == "/oauth-test":
-            # GET endpoint to test OAuth tokens
-            auth_header = self.headers.get("Authorization")
-            if not auth_header or not auth_header.startswith("Bearer "):
-                self._unauthorized_bearer()
-                return
-
-            token = auth_header.split(" ", 1)[1].strip()
-            if token.startswith("oauth_token_"):
-                # Extract provider from token (oauth_token_generic_123456)
-                parts = token.split("_")
-                provider = parts[2] if len(parts) >= 3 else "unknown"
-                self._send_json({
-                    "oauth_test": "success",
-                    "token_valid": True,
-                    "provider": provider,
-                    "token_prefix": token[:20] + "..."
-                })
-            else:
-                self._unauthorized_bearer()
+    def _handle_apikey(self):
+        """GET /apikey: API Key Auth (supports both Authorization header and X-API-Key)"""
+        auth_header = self.headers.get("Authorization", "")
+        api_key_header = self.headers.get("X-API-Key")
+
+        api_key = None
+
+        # Check Authorization header first
+        if auth_header[:len(APIKEY_PREFIX)] == APIKEY_PREFIX:
+            api_key = auth_header[len(APIKEY_PREFIX):].strip()
+        # Fall back to X-API-Key header
+        elif api_key_header:
+            api_key = api_key_header.strip()
+
+        if not api_key:
+            self._unauthorized_apikey()
+            return
+
+        if secure_equals(api_key, API_KEY):
+            self._send_bytes(APIKEY_OK_BODY)
+        else:
+            self._unauthorized_apikey()
+
+    def _handle_oauth_test(self):
+        """GET /oauth-test: GET endpoint to test OAuth tokens"""
+        auth_header = self.headers.get("Authorization", "")
+        if auth_header[:len(BEARER_PREFIX)] != BEARER_PREFIX:
+            self._unauthorized_bearer()
+            return
+
+        token = auth_header[len(BEARER_PREFIX):].strip()
+        if token.startswith("oauth_token_"):
+            # Extract provider from token (oauth_token_generic_123456)
+            parts = token.split("_")
+            provider = parts[2] if len(parts) >= 3 else "unknown"
+            self._send_json({
+                "oauth_test": "success",
+                "token_valid": True,
+                "provider": provider,
+                "token_prefix": token[:20] + "..."
+            })
         else:
-            self.send_response(404)
-            self.end_headers()
-            self.wfile.write(b'{"error":"Not Found"}')
+            self._unauthorized_bearer()
+
+    def _handle_echo(self):
+        """POST /echo: simple POST endpoint"""
+        self._send_bytes(ECHO_BODY)
+
+    def _handle_secure(self):
+        """POST /secure: POST endpoint with Basic Auth"""
+        credentials = self._basic_auth_credentials()
+        if credentials is None:
+            self._unauthorized()
+            return
+
+        username, password = credentials
+        if secure_equals(username, USERNAME) & secure_equals(password, PASSWORD):
+            self._send_json({"secure": "success", "user": username})
+        else:
+            self._unauthorized()
 
-    def do_POST(self):
+    def _handle_oauth_token(self):
+        """POST /oauth/token: generic OAuth token endpoint (Basic Auth + form data)"""
+        params = self._read_form()
+        if params is None:
+            self._oauth_error("invalid_request", "Invalid form body")
+            return
+
+        if params.get("grant_type") != "client_credentials":
+            self._oauth_error("unsupported_grant_type", "Only client_credentials supported")
+            return
+
+        if self._validate_basic_auth("generic"):
+            self._oauth_success("generic")
+        else:
+            self._oauth_error("invalid_client", "Invalid client credentials")
+
+    def _handle_oauth2_token(self):
+        """POST /oauth2/token: AWS Cognito style (Basic Auth + form data)"""
+        params = self._read_form()
+        if params is None:
+            self._oauth_error("invalid_request")
+            return
+
+        if params.get("grant_type") != "client_credentials":
+            self._oauth_error("unsupported_grant_type")
+            return
+
+        if self._validate_basic_auth("cognito"):
+            self._oauth_success("cognito")
+        else:
+            self._oauth_error("invalid_client")
+
+    def _handle_oauth_token_auth0(self):
+        """POST /oauth/token/auth0: Auth0 style (JSON body)"""
+        try:
+            data = json_loads(self.body)
+        except ValueError:
+            # JSONDecodeError and UnicodeDecodeError are both ValueErrors
+            self._oauth_error("invalid_request", "Invalid JSON body")
+            return
+
+        if not isinstance(data, dict):
+            self._oauth_error("invalid_request", "JSON body must be an object")
+            return
+
+        if data.get("grant_type") != "client_credentials":
+            self._oauth_error("unsupported_grant_type")
+            return
+
+        if (secure_equals(data.get("client_id"), OAUTH_AUTH0_CLIENT_ID) &
+            secure_equals(data.get("client_secret"), OAUTH_AUTH0_CLIENT_SECRET)):
+            self._oauth_success("auth0")
+        else:
+            self._oauth_error("invalid_client")
+
+    def _handle_oauth_v2_accesstoken(self):
+        """POST /oauth/v2/accesstoken: Apigee style (form data in body)"""
+        params = self._read_form()
+        if params is None:
+            self._oauth_error("invalid_request")
+            return
+
+        if params.get("grant_type") != "client_credentials":
+            self._oauth_error("unsupported_grant_type")
+            return
+
+        if (secure_equals(params.get("client_id"), OAUTH_APIGEE_CLIENT_ID) &
+            secure_equals(params.get("client_secret"), OAUTH_APIGEE_CLIENT_SECRET)):
+            self._oauth_success("apigee")
+        else:
+            self._oauth_error("invalid_client")
+
+    GET_ROUTES = {
+        "/hello": _handle_hello,
+        "/slow": _handle_slow,
+        "/bearer": _handle_bearer,
+        "/apikey": _handle_apikey,
+        "/oauth-test": _handle_oauth_test,
+    }
+
+    POST_ROUTES = {
+        "/echo": _handle_echo,
+        "/secure": _handle_secure,
+        "/oauth/token": _handle_oauth_token,
+        "/oauth2/token": _handle_oauth2_token,
+        "/oauth/token/auth0": _handle_oauth_token_auth0,
+        "/oauth/v2/accesstoken": _handle_oauth_v2_accesstoken,
+    }
+
+    def _dispatch(self, routes):
+        """Helper: consume the request body, then run the handler for self.path"""
         self._log_headers()
-        if self.path == "/echo":
-            # simple POST endpoint
-            self._send_json({"message": "This is a POST response"})
-        elif self.path == "/secure":
-            # POST endpoint with Basic Auth
-            auth_header = self.headers.get("Authorization")
-            if not auth_header or not auth_header.startswith("Basic "):
-                self._unauthorized()
-                return
-
-            try:
-                encoded = auth_header.split(" ", 1)[1]
-                decoded = base64.b64decode(encoded).decode("utf-8")
-                username, password = decoded.split(":", 1)
-            except Exception:
-                self._unauthorized()
-                return
-
-            if username == USERNAME and password == PASSWORD:
-                self._send_json({"secure": "success", "user": username})
-            else:
-                self._unauthorized()
-        elif self.path == "/oauth/token":
-            # Generic OAuth token endpoint (Basic Auth + form data)
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length).decode('utf-8')
-
-            if "grant_type=client_credentials" not in body:
-                self._oauth_error("unsupported_grant_type", "Only client_credentials supported")
-                return
-
-            if self._validate_basic_auth(OAUTH_CLIENT_ID, OAUTH_CLIENT_SECRET):
-                self._oauth_success("generic")
-            else:
-                self._oauth_error("invalid_client", "Invalid client credentials")
-        elif self.path == "/oauth2/token":
-            # AWS Cognito style (Basic Auth + form data)
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length).decode('utf-8')
-
-            if "grant_type=client_credentials" not in body:
-                self._oauth_error("unsupported_grant_type")
-                return
-
-            if self._validate_basic_auth(OAUTH_COGNITO_CLIENT_ID, OAUTH_COGNITO_CLIENT_SECRET):
-                self._oauth_success("cognito")
-            else:
-                self._oauth_error("invalid_client")
-        elif self.path == "/oauth/token/auth0":
-            # Auth0 style (JSON body)
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length).decode('utf-8')
-
-            try:
-                data = json.loads(body)
-                if data.get("grant_type") != "client_credentials":
-                    self._oauth_error("unsupported_grant_type")
-                    return
-
-                if (data.get("client_id") == OAUTH_AUTH0_CLIENT_ID and
-                    data.get("client_secret") == OAUTH_AUTH0_CLIENT_SECRET):
-                    self._oauth_success("auth0")
-                else:
-                    self._oauth_error("invalid_client")
-            except json.JSONDecodeError:
-                self._oauth_error("invalid_request", "Invalid JSON body")
-        elif self.path == "/oauth/v2/accesstoken":
-            # Apigee style (form data in body)
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length).decode('utf-8')
-
-            # Parse form data
-            params = {}
-            for param in body.split('&'):
-                if '=' in param:
-                    key, value = param.split('=', 1)
-                    params[key] = value
-
-            if params.get("grant_type") != "client_credentials":
-                self._oauth_error("unsupported_grant_type")
-                return
-
-            if (params.get("client_id") == OAUTH_APIGEE_CLIENT_ID and
-                params.get("client_secret") == OAUTH_APIGEE_CLIENT_SECRET):
-                self._oauth_success("apigee")
-            else:
-                self._oauth_error("invalid_client")
+        # Read the body for every method so it is never parsed as the next
+        # request on a kept-alive connection
+        self.body = self._read_body()
+        if self.body is None:
+            return
+        handler = routes.get(self.path)
+        if handler:
+            handler(self)
         else:
-            self.send_response(404)
-            self.end_headers()
-            self.wfile.write(b'{"error":"Not Found"}')
+            self._send_bytes(NOT_FOUND_BODY, 404)
+
+    def do_GET(self):
+        self._dispatch(self.GET_ROUTES)
+
+    def do_POST(self):
+        self._dispatch(self.POST_ROUTES)
 
 
 if __name__ == "__main__":
-    server = HTTPServer((HOST, PORT), SimpleHandler)
+    server = DevServer((HOST, PORT), SimpleHandler)
     print(f"Serving on http://{HOST}:{PORT}")
     server.serve_forever()
-
@@ -39,6 +39,11 @@ if ! command -v nvim &> /dev/null; then
     handle_error "nvim is not installed"
 fi
 
+# Check if python3 is installed (runs the dev server checks)
+if ! command -v python3 &> /dev/null; then
+    handle_error "python3 is not installed"
+fi
+
 # Ensure plenary.nvim dependency is available
 print_section "Installing dependencies"
 if [ ! -d "deps/plenary.nvim" ]; then
@@ -69,4 +74,13 @@ else
 fi
 echo
 
+# Run dev server checks
+print_section "Running dev server tests"
+if python3 -m unittest scripts/test_server.py; then
+    echo -e "${GREEN}Dev server tests passed${NC}"
+else
+    handle_error "Dev server tests failed"
+fi
+echo
+
 echo -e "${GREEN}All checks passed! ✓${NC}"
\ No newline at end of file
@@ -0,0 +1,230 @@
+"""Regression checks for the development server (python -m unittest scripts/test_server.py)"""
+import importlib.util
+import json
+import os
+import socket
+import threading
+import time
+import unittest
+
+_spec = importlib.util.spec_from_file_location(
+    "server", os.path.join(os.path.dirname(__file__), "server.py")
+)
+server = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(server)
+
+
+class QuietHandler(server.SimpleHandler):
+    server_version = "HolaTest/1.0"
+
+    GET_ROUTES = {
+        **server.SimpleHandler.GET_ROUTES,
+        "/fail": lambda self: self._send_json({"error": "fail"}, 500),
+    }
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ServerTestCase(unittest.TestCase):
+    """Runs a DevServer on an ephemeral port for the duration of the class"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = server.DevServer(("127.0.0.1", 0), QuietHandler)
+        cls.port = cls.server.server_address[1]
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def _exchange(self, raw):
+        """Send raw request bytes and read until the server closes"""
+        with socket.create_connection(("127.0.0.1", self.port), timeout=5) as sock:
+            sock.sendall(raw)
+            chunks = []
+            while True:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    return b"".join(chunks)
+                chunks.append(chunk)
+
+
+class KeepAliveTest(ServerTestCase):
+    def test_get_body_is_not_parsed_as_next_request(self):
+        smuggled = b"GET /nope HTTP/1.1\r\n\r\n"
+        raw = (
+            b"GET /hello HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n%s"
+            b"GET /hello HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n"
+        ) % (len(smuggled), smuggled)
+
+        response = self._exchange(raw)
+
+        self.assertEqual(response.count(b"HTTP/1.1 200 OK"), 2)
+        self.assertNotIn(b"404", response)
+
+    def test_chunked_body_is_rejected_and_connection_closed(self):
+        raw = (
+            b"POST /echo HTTP/1.1\r\nHost: x\r\nTransfer-Encoding: chunked\r\n\r\n"
+            b"5\r\nhello\r\n0\r\n\r\n"
+            b"GET /hello HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n"
+        )
+
+        response = self._exchange(raw)
+
+        self.assertEqual(response.count(b"HTTP/1.1 "), 1)
+        self.assertTrue(response.startswith(b"HTTP/1.1 501 "))
+        self.assertIn(b"\r\nConnection: close\r\n", response)
+
+
+
+class ResponseHeadersTest(ServerTestCase):
+    def test_handler_responses_carry_date_and_server(self):
+        response = self._exchange(
+            b"GET /hello HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n"
+        )
+        headers = response.split(b"\r\n\r\n", 1)[0].split(b"\r\n")
+
+        self.assertIn(b"Server: " + QuietHandler.server_version.encode(), headers[1])
+        self.assertTrue(headers[2].startswith(b"Date: "))
+
+    def test_status_outside_prebuilt_set_is_sent(self):
+        response = self._exchange(
+            b"GET /fail HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n"
+        )
+
+        self.assertTrue(response.startswith(b"HTTP/1.1 500 Internal Server Error\r\n"))
+        self.assertTrue(response.endswith(b'{"error":"fail"}'))
+
+
+class BodyLimitTest(ServerTestCase):
+    def _post(self, length_header, body=b""):
+        return self._exchange(
+            b"POST /echo HTTP/1.1\r\nHost: x\r\nContent-Length: %s\r\n\r\n%s"
+            % (length_header, body)
+        )
+
+    def test_oversized_body_gets_413_and_close(self):
+        response = self._post(b"%d" % (server.MAX_BODY + 1))
+
+        self.assertTrue(response.startswith(b"HTTP/1.1 413 "))
+        self.assertIn(b"\r\nConnection: close\r\n", response)
+        self.assertTrue(response.endswith(server.TOO_LARGE_BODY))
+
+    def test_invalid_content_length_gets_400_and_close(self):
+        for length in (b"-5", b"abc"):
+            with self.subTest(length=length):
+                response = self._post(length)
+
+                self.assertTrue(response.startswith(b"HTTP/1.1 400 "))
+                self.assertIn(b"\r\nConnection: close\r\n", response)
+                self.assertTrue(response.endswith(server.BAD_LENGTH_BODY))
+
+
+class OAuthBasicAuthTest(ServerTestCase):
+    def _token(self, path, encoded):
+        body = b"grant_type=client_credentials"
+        return self._exchange(
+            b"POST %s HTTP/1.1\r\nHost: x\r\nConnection: close\r\n"
+            b"Authorization: Basic %s\r\nContent-Length: %d\r\n\r\n%s"
+            % (path, encoded, len(body), body)
+        )
+
+    def test_blob_variants_match_the_client(self):
+        blob = server.basic_auth_blob(
+            server.OAUTH_CLIENT_ID, server.OAUTH_CLIENT_SECRET
+        ).encode()
+        for encoded in (blob, blob + b" ", blob[:8] + b" " + blob[8:]):
+            with self.subTest(encoded=encoded):
+                response = self._token(b"/oauth/token", encoded)
+
+                self.assertTrue(response.startswith(b"HTTP/1.1 200 "))
+
+    def test_other_client_or_wrong_secret_is_rejected(self):
+        cognito = server.basic_auth_blob(
+            server.OAUTH_COGNITO_CLIENT_ID, server.OAUTH_COGNITO_CLIENT_SECRET
+        ).encode()
+        wrong = server.basic_auth_blob(server.OAUTH_CLIENT_ID, "nope").encode()
+        for encoded in (cognito, wrong, b"!!!"):
+            with self.subTest(encoded=encoded):
+                response = self._token(b"/oauth/token", encoded)
+
+                self.assertTrue(response.startswith(b"HTTP/1.1 400 "))
+                self.assertIn(b'"error":"invalid_client"', response)
+
+
+
+class OAuthFormTest(ServerTestCase):
+    def _form_token(self, body):
+        encoded = server.basic_auth_blob(
+            server.OAUTH_CLIENT_ID, server.OAUTH_CLIENT_SECRET
+        ).encode()
+        return self._exchange(
+            b"POST /oauth/token HTTP/1.1\r\nHost: x\r\nConnection: close\r\n"
+            b"Authorization: Basic %s\r\nContent-Length: %d\r\n\r\n%s"
+            % (encoded, len(body), body)
+        )
+
+    def test_percent_encoded_grant_type_is_decoded(self):
+        response = self._form_token(b"grant_type=client%5Fcredentials")
+
+        self.assertTrue(response.startswith(b"HTTP/1.1 200 "))
+
+    def test_grant_type_inside_another_value_does_not_match(self):
+        response = self._form_token(b"grant_type=password&x=grant_type=client_credentials")
+
+        self.assertTrue(response.startswith(b"HTTP/1.1 400 "))
+        self.assertIn(b'"error":"unsupported_grant_type"', response)
+
+    def test_too_many_fields_is_invalid_request(self):
+        body = b"&".join(b"f%d=1" % i for i in range(server.MAX_FORM_FIELDS + 1))
+
+        response = self._form_token(body)
+
+        self.assertTrue(response.startswith(b"HTTP/1.1 400 "))
+        self.assertIn(b'"error":"invalid_request"', response)
+
+
+class OAuthTokenTest(ServerTestCase):
+    def test_token_response_matches_baseline_shape(self):
+        body = (
+            b"grant_type=client_credentials&client_id=%s&client_secret=%s"
+            % (server.OAUTH_APIGEE_CLIENT_ID.encode(),
+               server.OAUTH_APIGEE_CLIENT_SECRET.encode())
+        )
+        response = self._exchange(
+            b"POST /oauth/v2/accesstoken HTTP/1.1\r\nHost: x\r\nConnection: close\r\n"
+            b"Content-Length: %d\r\n\r\n%s" % (len(body), body)
+        )
+        data = json.loads(response.split(b"\r\n\r\n", 1)[1])
+
+        prefix, issued = data.pop("access_token").rsplit("_", 1)
+        self.assertEqual(prefix, "oauth_token_apigee")
+        self.assertLessEqual(abs(int(issued) - time.time()), 2)
+        self.assertEqual(data, {
+            "token_type": "Bearer",
+            "expires_in": 3600,
+            "scope": "read:users write:orders",
+        })
+
+
+
+class Auth0BodyTest(ServerTestCase):
+    def test_non_object_json_is_invalid_request(self):
+        for body in (b"[1]", b'"text"', b"null"):
+            with self.subTest(body=body):
+                response = self._exchange(
+                    b"POST /oauth/token/auth0 HTTP/1.1\r\nHost: x\r\n"
+                    b"Connection: close\r\nContent-Length: %d\r\n\r\n%s"
+                    % (len(body), body)
+                )
+
+                self.assertTrue(response.startswith(b"HTTP/1.1 400 "))
+                self.assertIn(b'"error":"invalid_request"', response)
+
+
+
+if __name__ == "__main__":
+    unittest.main()